@@ -1,27 +1,216 @@
-from typing import Optional, Dict, Tuple
+from array import array
+from typing import Optional, Dict, Tuple, List, Sequence
+import logging
+import math
+import os
+import struct
+import sys
+import tempfile
 import unittest
 
+# messages are only formatted when the level is enabled; without a configured handler only warnings and errors show
+logger = logging.getLogger(__name__)
+
+# log message templates, built once at import and formatted lazily by the logger
+_CUSTOMER_EXISTS_MSG = "Error: Customer '%s' already exists."
+_CUSTOMER_CREATED_MSG = "Customer profile for '%s' created successfully."
+_CANNOT_REMOVE_MSG = "Error: Customer '%s' does not exist. Cannot remove."
+_CUSTOMER_REMOVED_MSG = "Customer profile for '%s' removed successfully."
+_CANNOT_LEND_MSG = "Error: Customer '%s' does not exist. Cannot issue loan."
+_INVALID_AMOUNT_MSG = "Error: Loan amount must be a positive finite number up to $10,000,000,000,000."
+_INVALID_RATE_MSG = "Error: Interest rate must be a finite number between -10000% and 10000%."
+_LOAN_MSG = "Loan granted to %s: $%.2f at %.1f%% interest."
+_TOTAL_DEBT_MSG = "Total debt (including interest): $%.2f"
+_LEND_BATCH_LENGTH_MSG = "Error: Names, amounts and interest rates must have the same length."
+_LEND_BATCH_MSG = "Loans granted to %d customers."
+_CANNOT_REPAY_MSG = "Error: Customer '%s' does not exist. Cannot receive repayment."
+_INVALID_REPAYMENT_MSG = ("Error: Repayment amount from %s must be a positive finite number up to "
+                          "$10,000,000,000,000. Payment rejected.")
+_DEBT_SETTLED_MSG = "Notice: %s has already settled their outstanding debt. Payment rejected."
+_OVERPAYMENT_MSG = "Warning: Attempted payment of $%.2f exceeds outstanding debt."
+_PARTIAL_ACCEPT_MSG = "Only $%.2f accepted to settle the debt."
+_REPAYMENT_MSG = "Repayment received from %s: $%.2f"
+_REPAYMENT_BATCH_LENGTH_MSG = "Error: Names and amounts must have the same length."
+_REPAYMENT_BATCH_MSG = "Repayments received from %d customers."
+_CUSTOMER_NOT_FOUND_MSG = "Error: Customer '%s' not found."
+_RECORD_TOO_LONG_MSG = "Error: Customer '%s' has profile fields too long to save."
+_PROFILE_TOO_LONG_MSG = ("Error: Customer '%s' profile fields are too long (name 128, nationality 64, email 256, "
+                         "nationality_id 64 UTF-8 bytes).")
+_SAVED_MSG = "Saved %d customers to '%s'."
+_SAVE_FAILED_MSG = "Error: Could not write bank file '%s': %s"
+_LOAD_FAILED_MSG = "Error: Could not read bank file '%s': %s"
+_NOT_BANK_FILE_MSG = "Error: '%s' is not a saved bank file."
+_DUPLICATE_RECORD_MSG = "Error: Customer '%s' appears more than once in '%s'."
+
+# a saved bank file is a header (magic bytes, format version) followed by one fixed-size little-endian record
+# per customer: name, nationality, email, nationality_id (UTF-8, NUL padded) then principal, rate bps,
+# repayments and debt
+_FILE_HEADER = struct.Struct("<8sI")
+_FILE_MAGIC = b"BANKSYS\0"
+_FILE_VERSION = 2
+_RECORD_TEXT_SIZES = (128, 64, 256, 64)
+_RECORD = struct.Struct("<%ds%ds%ds%dsqqqq" % _RECORD_TEXT_SIZES)
+
+
+# profile fields must fit their fixed-size record fields, checked on creation so every customer can be saved
+def _profile_fits(name: str, nationality: str, email: str, nationality_id: str) -> bool:
+    return all(len(text.encode("utf-8")) <= size
+               for text, size in zip((name, nationality, email, nationality_id), _RECORD_TEXT_SIZES))
+
+
+# limits that keep every principal, repayment and debt (up to principal * 101) inside the int64 loan columns
+_MAX_CENTS = 10 ** 15
+_MAX_RATE_BPS = 10 ** 6
+
+
+# money is kept as integer cents and interest rates as integer basis points, floats only at the API boundary.
+# inf, nan and values beyond the limits convert to None, which callers reject like any other invalid amount or rate
+def _to_cents(amount: float) -> Optional[int]:
+    if not math.isfinite(amount):
+        return None
+    cents = int(round(amount * 100))
+    return cents if abs(cents) <= _MAX_CENTS else None
+
+
+def _to_bps(rate: float) -> Optional[int]:
+    if not math.isfinite(rate):
+        return None
+    rate_bps = int(round(rate * 10000))
+    return rate_bps if abs(rate_bps) <= _MAX_RATE_BPS else None
+
+
+# Customer attributes cannot report failure through a return value, so they raise instead
+def _require_finite(value: Optional[int], field: str) -> int:
+    if value is None:
+        raise ValueError(f"{field} must be a finite number within the supported range.")
+    return value
+
+
+# growth factor (1 + rate) in basis points, computed once whenever the rate is set
+def _growth_bps(rate_bps: int) -> int:
+    return 10000 + rate_bps
+
+
+# simple interest on the principal, rounded half up to the nearest cent
+def _total_debt_cents(principal_cents: int, growth_bps: int) -> int:
+    return (principal_cents * growth_bps + 5000) // 10000
+
 
 class Customer:
+    # no per-instance __dict__; subclasses must declare their own __slots__ to keep this
+    __slots__ = ("name", "nationality", "email", "nationality_id", "_principal_cents", "_rate_bps", "_growth_bps",
+                 "_repayments_cents", "_debt_cents", "_outstanding_cents", "_bank", "_row")
 
     def __init__(self, name: str, nationality: str, email: str, nationality_id: str, principal_amount: float,
                  interest_rate: float):
         """Customer profile Fields and loan Fields and Calculate the fixed total debt using simple interest"""
+        self._reset(name, nationality, email, nationality_id, principal_amount, interest_rate)
+
+    def _reset(self, name: str, nationality: str, email: str, nationality_id: str, principal_amount: float,
+               interest_rate: float) -> None:
+        # owning BankSystem and this customer's row in its loan columns, None and -1 while unregistered
+        self._bank = None
+        self._row = -1
+
         # Profile Fields
         self.name = name
         self.nationality = nationality
         self.email = email
         self.nationality_id = nationality_id
 
-        self.principal_amount = principal_amount
-        self.interest_rate = interest_rate
-        self.total_repayments = 0.0
-
-        self.total_debt_owed = round(self.principal_amount * (1 + self.interest_rate), 2)
-
-    # calculate outstanding debt
+        self._set_loan(_require_finite(_to_cents(principal_amount), "principal_amount"),
+                       _require_finite(_to_bps(interest_rate), "interest_rate"), 0)
+
+    # wipe the profile so a pooled customer does not keep personal data around until it is reused
+    def _clear(self) -> None:
+        self.name = ""
+        self.nationality = ""
+        self.email = ""
+        self.nationality_id = ""
+
+    # the only writer of the loan fields, so the growth factor, the cached outstanding balance and the owning
+    # bank's loan row never go stale. Without debt_cents the debt is recalculated from the new principal and rate;
+    # batch callers may pass the growth factor they already computed for rate_bps
+    def _set_loan(self, principal_cents: int, rate_bps: int, repayments_cents: int,
+                  debt_cents: Optional[int] = None, growth_bps: Optional[int] = None) -> None:
+        if growth_bps is None:
+            growth_bps = _growth_bps(rate_bps)
+        if debt_cents is None:
+            debt_cents = _total_debt_cents(principal_cents, growth_bps)
+
+        # the bank's row is written first: if it rejects a value, the customer is still unchanged as well
+        if self._bank is not None:
+            self._bank._store_loan(self._row, principal_cents, rate_bps, repayments_cents, debt_cents)
+
+        self._principal_cents = principal_cents
+        self._rate_bps = rate_bps
+        self._growth_bps = growth_bps
+        self._repayments_cents = repayments_cents
+        self._debt_cents = debt_cents
+        self._outstanding_cents = debt_cents - repayments_cents
+
+    # calculate the fixed total debt for the current loan terms
+    def _recompute_debt(self) -> int:
+        return _total_debt_cents(self._principal_cents, self._growth_bps)
+
+    def _add_repayment(self, paid_cents: int) -> None:
+        self._set_loan(self._principal_cents, self._rate_bps, self._repayments_cents + paid_cents, self._debt_cents)
+
+    @property
+    def principal_cents(self) -> int:
+        return self._principal_cents
+
+    @property
+    def rate_bps(self) -> int:
+        return self._rate_bps
+
+    @property
+    def repayments_cents(self) -> int:
+        return self._repayments_cents
+
+    @property
+    def debt_cents(self) -> int:
+        return self._debt_cents
+
+    # changing the principal or the rate recalculates the total debt, repayments are kept
+    @property
+    def principal_amount(self) -> float:
+        return self._principal_cents / 100
+
+    @principal_amount.setter
+    def principal_amount(self, amount: float) -> None:
+        self._set_loan(_require_finite(_to_cents(amount), "principal_amount"), self._rate_bps, self._repayments_cents)
+
+    # held to whole basis points (0.01%), finer rates are rounded to the nearest one
+    @property
+    def interest_rate(self) -> float:
+        return self._rate_bps / 10000
+
+    @interest_rate.setter
+    def interest_rate(self, rate: float) -> None:
+        self._set_loan(self._principal_cents, _require_finite(_to_bps(rate), "interest_rate"), self._repayments_cents)
+
+    @property
+    def total_debt_owed(self) -> float:
+        return self._debt_cents / 100
+
+    @total_debt_owed.setter
+    def total_debt_owed(self, amount: float) -> None:
+        self._set_loan(self._principal_cents, self._rate_bps, self._repayments_cents,
+                       _require_finite(_to_cents(amount), "total_debt_owed"))
+
+    @property
+    def total_repayments(self) -> float:
+        return self._repayments_cents / 100
+
+    @total_repayments.setter
+    def total_repayments(self, amount: float) -> None:
+        self._set_loan(self._principal_cents, self._rate_bps, _require_finite(_to_cents(amount), "total_repayments"),
+                       self._debt_cents)
+
+    # outstanding debt is kept up to date on every change, so reading it does no arithmetic
     def get_outstanding_debt(self) -> float:
-        return round(self.total_debt_owed - self.total_repayments, 2)
+        return self._outstanding_cents / 100
 
     # return current status of customer total repayments and outstanding debt
     def get_status(self) -> Tuple[float, float]:
@@ -29,83 +218,225 @@ class Customer:
 
 
 class BankSystem:
+    _POOL_CAP = 1024
 
     def __init__(self):
         self.customers: Dict[str, Customer] = {}
 
+        # customers removed from this bank, reused by create_customer instead of allocating new objects
+        self._pool: List[Customer] = []
+
+        # loan fields of every customer stored column-wise, row i belongs to self._rows[i] (customer._row == i)
+        self._rows: List[Customer] = []
+        self._principal = array("q")
+        self._rate = array("q")
+        self._repay = array("q")
+        self._debt = array("q")
+
     # create customer fields with initial value for principal_amount=0.0 and interest_rate=0.0
+    # the returned object may be one this bank removed earlier, see remove_customer
     def create_customer(self, name: str, nationality: str = "", email: str = "", nationality_id: str = "") -> Optional[
         Customer]:
 
+        # interned keys let later lookups with the same name match on identity before comparing characters
+        name = sys.intern(name)
         if name in self.customers:
-            print(f"Error: Customer '{name}' already exists.")
+            logger.error(_CUSTOMER_EXISTS_MSG, name)
+            return None
+
+        if not _profile_fits(name, nationality, email, nationality_id):
+            logger.error(_PROFILE_TOO_LONG_MSG, name)
             return None
 
-        customer = Customer(name, nationality, email, nationality_id, principal_amount=0.0, interest_rate=0.0)
+        customer = self._acquire_customer(name, nationality, email, nationality_id)
         self.customers[name] = customer
-        print(f"Customer profile for '{name}' created successfully.")
+        self._append_row(customer)
+        logger.info(_CUSTOMER_CREATED_MSG, name)
         return customer
 
+    # remove customer profile and return the object to this bank's pool; references to the removed customer
+    # must be dropped, because the same object is handed out again by the next create_customer on this bank
+    def remove_customer(self, name: str) -> bool:
+        customer = self.customers.pop(name, None)
+        if customer is None:
+            logger.error(_CANNOT_REMOVE_MSG, name)
+            return False
+
+        self._remove_row(customer)
+        self._release_customer(customer)
+        logger.info(_CUSTOMER_REMOVED_MSG, name)
+        return True
+
+    def _acquire_customer(self, name: str, nationality: str, email: str, nationality_id: str) -> Customer:
+        if not self._pool:
+            return Customer(name, nationality, email, nationality_id, principal_amount=0.0, interest_rate=0.0)
+        customer = self._pool.pop()
+        customer._reset(name, nationality, email, nationality_id, principal_amount=0.0, interest_rate=0.0)
+        return customer
+
+    def _release_customer(self, customer: Customer) -> None:
+        customer._clear()
+        if len(self._pool) < self._POOL_CAP:
+            self._pool.append(customer)
+
+    def _append_row(self, customer: Customer) -> None:
+        customer._bank = self
+        customer._row = len(self._rows)
+        self._rows.append(customer)
+        self._principal.append(customer.principal_cents)
+        self._rate.append(customer.rate_bps)
+        self._repay.append(customer.repayments_cents)
+        self._debt.append(customer.debt_cents)
+
+    # move the last row into the removed slot so the columns stay dense
+    def _remove_row(self, customer: Customer) -> None:
+        i = customer._row
+        customer._bank = None
+        customer._row = -1
+        last_customer = self._rows.pop()
+        for column in (self._principal, self._rate, self._repay, self._debt):
+            last_value = column.pop()
+            if i < len(column):
+                column[i] = last_value
+        if last_customer is not customer:
+            self._rows[i] = last_customer
+            last_customer._row = i
+
+    # called by Customer._set_loan before it updates itself, the columns mirror the customer's loan fields.
+    # Values are checked against the int64 columns first so a rejected row is not left half written
+    def _store_loan(self, i: int, principal_cents: int, rate_bps: int, repayments_cents: int,
+                    debt_cents: int) -> None:
+        array("q", (principal_cents, rate_bps, repayments_cents, debt_cents))
+        self._principal[i] = principal_cents
+        self._rate[i] = rate_bps
+        self._repay[i] = repayments_cents
+        self._debt[i] = debt_cents
+
     def check_customer_exist(self, name: str) -> bool:
         if name not in self.customers:
-            print(f"Error: Customer '{name}' does not exist. Cannot issue loan.")
+            logger.error(_CANNOT_LEND_MSG, name)
             return False
         return True
 
     # customer can lend money and lend with interest_rate
     def lend(self, name: str, amount: float, interest_rate: float) -> bool:
-        if not self.check_customer_exist(name):
+        current_customer = self.customers.get(name)
+        if current_customer is None:
+            logger.error(_CANNOT_LEND_MSG, name)
+            return False
+
+        principal_cents = _to_cents(amount)
+        if principal_cents is None or principal_cents <= 0:
+            logger.error(_INVALID_AMOUNT_MSG)
             return False
 
-        if amount <= 0:
-            print("Error: Loan amount must be positive.")
+        rate_bps = _to_bps(interest_rate)
+        if rate_bps is None:
+            logger.error(_INVALID_RATE_MSG)
             return False
 
-        current_customer = self.customers[name]
+        # update the loan in place, the profile fields stay untouched
+        current_customer._set_loan(principal_cents, rate_bps, 0)
 
-        self.customers[name] = Customer(
-            name,
-            current_customer.nationality,
-            current_customer.email,
-            current_customer.nationality_id,
-            principal_amount=amount,
-            interest_rate=interest_rate
-        )
+        logger.info(_LOAN_MSG, name, amount, interest_rate * 100)
+        logger.info(_TOTAL_DEBT_MSG, current_customer.debt_cents / 100)
+        return True
+
+    # issue many loans in one call, the whole batch is rejected if any entry is invalid
+    def lend_batch(self, names: Sequence[str], amounts: Sequence[float], interest_rates: Sequence[float]) -> bool:
+        if not len(names) == len(amounts) == len(interest_rates):
+            logger.error(_LEND_BATCH_LENGTH_MSG)
+            return False
+
+        customers = [self.customers.get(name) for name in names]
+        for name, customer in zip(names, customers):
+            if customer is None:
+                logger.error(_CANNOT_LEND_MSG, name)
+                return False
+
+        # convert every amount and rate before touching any customer, so a bad entry leaves the bank unchanged
+        principals = [_to_cents(amount) for amount in amounts]
+        if any(principal is None or principal <= 0 for principal in principals):
+            logger.error(_INVALID_AMOUNT_MSG)
+            return False
+
+        rates = [_to_bps(rate) for rate in interest_rates]
+        if any(rate is None for rate in rates):
+            logger.error(_INVALID_RATE_MSG)
+            return False
+        growths = [_growth_bps(rate) for rate in rates]
+
+        for customer, principal, rate, growth in zip(customers, principals, rates, growths):
+            customer._set_loan(principal, rate, 0, growth_bps=growth)
 
-        total_debt = self.customers[name].total_debt_owed
-        print(f"Loan granted to {name}: ${amount:,.2f} at {interest_rate * 100:.1f}% interest.")
-        print(f"Total debt (including interest): ${total_debt:,.2f}")
+        logger.info(_LEND_BATCH_MSG, len(customers))
         return True
 
     # customer can repayment and should Prevent customers from paying back more than they owe
     def receive_repayment(self, name: str, amount: float) -> Optional[float]:
 
         customer = self.customers.get(name)
-        if not self.check_customer_exist(name):
+        if customer is None:
+            logger.error(_CANNOT_REPAY_MSG, name)
             return None
 
-        outstanding_debt = customer.get_outstanding_debt()
+        amount_cents = _to_cents(amount)
+        if amount_cents is None or amount_cents <= 0:
+            logger.error(_INVALID_REPAYMENT_MSG, name)
+            return 0.0
+
+        outstanding_cents = customer._outstanding_cents
 
-        if outstanding_debt <= 0:
-            print(f"Notice: {name} has already settled their outstanding debt. Payment rejected.")
+        if outstanding_cents <= 0:
+            logger.info(_DEBT_SETTLED_MSG, name)
             return 0.0
 
-        if amount > outstanding_debt:
-            actual_paid = outstanding_debt
-            print(f"Warning: Attempted payment of ${amount:,.2f} exceeds outstanding debt.")
-            print(f"Only ${actual_paid:,.2f} accepted to settle the debt.")
+        if amount_cents > outstanding_cents:
+            paid_cents = outstanding_cents
+            logger.warning(_OVERPAYMENT_MSG, amount)
+            logger.warning(_PARTIAL_ACCEPT_MSG, paid_cents / 100)
         else:
-            actual_paid = amount
-            print(f"Repayment received from {name}: ${actual_paid:,.2f}")
+            paid_cents = amount_cents
+            logger.info(_REPAYMENT_MSG, name, paid_cents / 100)
+
+        customer._add_repayment(paid_cents)
+        return paid_cents / 100
+
+    # receive many repayments in one call, each capped at the payer's outstanding debt
+    def receive_repayment_batch(self, names: Sequence[str], amounts: Sequence[float]) -> Optional[List[float]]:
+        if len(names) != len(amounts):
+            logger.error(_REPAYMENT_BATCH_LENGTH_MSG)
+            return None
 
-        customer.total_repayments += actual_paid
-        return actual_paid
+        customers = [self.customers.get(name) for name in names]
+        for name, customer in zip(names, customers):
+            if customer is None:
+                logger.error(_CANNOT_REPAY_MSG, name)
+                return None
+
+        # convert every amount before applying any payment, so a bad entry leaves the bank unchanged
+        amounts_cents = [_to_cents(amount) for amount in amounts]
+
+        # applied in order, so a customer listed twice is capped against the already reduced debt.
+        # Like receive_repayment, amounts that are not positive finite numbers are rejected and count as 0.0 paid
+        paid = []
+        for customer, amount_cents in zip(customers, amounts_cents):
+            if amount_cents is None or amount_cents <= 0:
+                logger.error(_INVALID_REPAYMENT_MSG, customer.name)
+                paid_cents = 0
+            else:
+                paid_cents = min(amount_cents, max(customer._outstanding_cents, 0))
+                customer._add_repayment(paid_cents)
+            paid.append(paid_cents / 100)
+
+        logger.info(_REPAYMENT_BATCH_MSG, len(customers))
+        return paid
 
     def get_customer_status(self, name: str) -> Optional[Dict[str, float]]:
 
         customer = self.customers.get(name)
         if not customer:
-            print(f"Error: Customer '{name}' not found.")
+            logger.error(_CUSTOMER_NOT_FOUND_MSG, name)
             return None
 
         total_repayments, debt = customer.get_status()
@@ -114,6 +445,86 @@ class BankSystem:
             "outstanding_debt": debt
         }
 
+    # sum of outstanding debt over all customers, read straight from the loan columns
+    def get_total_outstanding_debt(self) -> float:
+        return (sum(self._debt) - sum(self._repay)) / 100
+
+    # sum of repayments received from all customers
+    def get_total_repayments(self) -> float:
+        return sum(self._repay) / 100
+
+    # write every customer as one fixed-size record, in loan column order
+    def save(self, path: str) -> bool:
+        buffer = bytearray(_FILE_HEADER.size + _RECORD.size * len(self._rows))
+        _FILE_HEADER.pack_into(buffer, 0, _FILE_MAGIC, _FILE_VERSION)
+        for i, customer in enumerate(self._rows):
+            # profile fields are public and may have been edited after create_customer checked them
+            profile = (customer.name, customer.nationality, customer.email, customer.nationality_id)
+            if not _profile_fits(*profile):
+                logger.error(_RECORD_TOO_LONG_MSG, customer.name)
+                return False
+            texts = [text.encode("utf-8") for text in profile]
+            _RECORD.pack_into(buffer, _FILE_HEADER.size + i * _RECORD.size, *texts,
+                              self._principal[i], self._rate[i], self._repay[i], self._debt[i])
+
+        try:
+            with open(path, "wb") as f:
+                f.write(buffer)
+        except OSError as error:
+            logger.error(_SAVE_FAILED_MSG, path, error)
+            return False
+        logger.info(_SAVED_MSG, len(self._rows), path)
+        return True
+
+    # rebuild a bank from a file written by save(); the fixed-size records are unpacked without any text parsing
+    @classmethod
+    def load(cls, path: str) -> Optional["BankSystem"]:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as error:
+            logger.error(_LOAD_FAILED_MSG, path, error)
+            return None
+
+        if len(data) < _FILE_HEADER.size or _FILE_HEADER.unpack_from(data) != (_FILE_MAGIC, _FILE_VERSION) \
+                or (len(data) - _FILE_HEADER.size) % _RECORD.size:
+            logger.error(_NOT_BANK_FILE_MSG, path)
+            return None
+
+        bank = cls()
+        for *texts, principal, rate, repay, debt in _RECORD.iter_unpack(memoryview(data)[_FILE_HEADER.size:]):
+            try:
+                name, nationality, email, nationality_id = [text.rstrip(b"\0").decode("utf-8") for text in texts]
+            except UnicodeDecodeError:
+                logger.error(_NOT_BANK_FILE_MSG, path)
+                return None
+
+            name = sys.intern(name)
+            if name in bank.customers:
+                logger.error(_DUPLICATE_RECORD_MSG, name, path)
+                return None
+
+            customer = bank._acquire_customer(name, nationality, email, nationality_id)
+            customer._set_loan(principal, rate, repay, debt)
+            bank.customers[name] = customer
+            bank._append_row(customer)
+        return bank
+
+
+# --- Test output: keep the expected error and warning logs off the terminal for the whole module ---
+_previous_logging_disable = logging.NOTSET
+
+
+def setUpModule():
+    global _previous_logging_disable
+    _previous_logging_disable = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+
+
+# put back whatever disable level the test runner had set before this module ran
+def tearDownModule():
+    logging.disable(_previous_logging_disable)
+
 
 # --- Helper data for customer creation ---
 CUSTOMER_PROFILE = {
@@ -155,6 +566,42 @@ class TestCustomer(unittest.TestCase):
         # Debt: 550.00 - 200.00 = 350.00
         self.assertAlmostEqual(c.get_outstanding_debt(), 350.00)
 
+    def test_debt_is_rounded_to_the_cent(self):
+        """Test interest is computed on integer cents and rounded half up."""
+        c = Customer(**CUSTOMER_PROFILE, principal_amount=333.33, interest_rate=0.05)  # 349.9965 -> $350.00
+        self.assertEqual(c.principal_cents, 33333)
+        self.assertEqual(c.rate_bps, 500)
+        self.assertEqual(c._growth_bps, 10500)
+        self.assertEqual(c.debt_cents, 35000)
+        c.total_repayments = 0.1 + 0.2
+        self.assertEqual(c.repayments_cents, 30)
+        self.assertEqual(c.get_outstanding_debt(), 349.70)
+
+    def test_loan_attribute_setters(self):
+        """Test the float loan attributes stay assignable and keep the debt in sync."""
+        c = Customer(**CUSTOMER_PROFILE, principal_amount=100.00, interest_rate=0.20)  # Total debt = $120.00
+        c.total_repayments = 20.00
+        c.principal_amount = 200.00  # Total debt = $240.00
+        self.assertAlmostEqual(c.total_debt_owed, 240.00)
+        c.interest_rate = 0.10  # Total debt = $220.00
+        self.assertAlmostEqual(c.total_debt_owed, 220.00)
+        self.assertAlmostEqual(c.get_outstanding_debt(), 200.00)
+        c.total_debt_owed = 150.00
+        self.assertAlmostEqual(c.get_outstanding_debt(), 130.00)
+
+        # Rates are kept to whole basis points
+        c.interest_rate = 0.12346
+        self.assertEqual(c.rate_bps, 1235)
+
+    def test_cents_fields_are_read_only(self):
+        """Test the integer loan fields can only change through the float attributes."""
+        c = Customer(**CUSTOMER_PROFILE, principal_amount=100.00, interest_rate=0.20)  # Total debt = $120.00
+        with self.assertRaises(AttributeError):
+            c.repayments_cents = 5000
+        with self.assertRaises(AttributeError):
+            c.debt_cents = 0
+        self.assertAlmostEqual(c.get_outstanding_debt(), 120.00)
+
     def test_get_status(self):
         """Test the combined status reporting tuple."""
         c = Customer(**CUSTOMER_PROFILE, principal_amount=100.00, interest_rate=0.20)  # Total debt = $120.00
@@ -187,11 +634,49 @@ class TestBankSystem(unittest.TestCase):
         self.assertIn("Charlie", self.bank.customers)
         self.assertEqual(cust.nationality, "UK")
 
+    def test_create_customer_interns_name(self):
+        """Verify the stored name is the interned string even when built at runtime."""
+        name = "".join(["Char", "lie"])
+        cust = self.bank.create_customer(name)
+        self.assertIs(cust.name, sys.intern("Charlie"))
+        self.assertIs(next(key for key in self.bank.customers if key == "Charlie"), cust.name)
+
+    def test_create_customer_profile_limits(self):
+        """Verify profiles that could not be saved are refused on creation, realistic ones are accepted."""
+        self.assertIsNone(self.bank.create_customer("Charlie", email="c" * 257))
+        self.assertIsNone(self.bank.create_customer("Charlie", nationality_id="1" * 65))
+        self.assertNotIn("Charlie", self.bank.customers)
+
+        self.assertIsNotNone(self.bank.create_customer("Charlie", email="c" * 242 + "@example.com"))  # 254 bytes
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertTrue(self.bank.save(os.path.join(directory, "bank.dat")))
+
     def test_create_duplicate_customer(self):
         """Verify that duplicate customer creation is prevented."""
         # 'Bob' is created in setUp, attempt to create again.
         self.assertIsNone(self.bank.create_customer("Bob", "AU", "new@bob.com", "112233"))
 
+    def test_remove_customer(self):
+        """Verify removal frees the name and the released object is reused for the next customer."""
+        bob = self.bank.customers["Bob"]
+        self.bank.lend("Bob", 100.00, 0.20)
+        self.assertTrue(self.bank.remove_customer("Bob"))
+        self.assertNotIn("Bob", self.bank.customers)
+        self.assertFalse(self.bank.remove_customer("Bob"))
+        # The released object no longer carries Bob's profile
+        self.assertEqual((bob.name, bob.email, bob.nationality_id), ("", "", ""))
+
+        # Another bank never hands out this bank's released customers
+        eve = BankSystem().create_customer("Eve", "DE", "eve@test.de", "E789")
+        self.assertIsNot(eve, bob)
+
+        dave = self.bank.create_customer("Dave", "FR", "dave@test.fr", "D456")
+        self.assertIs(dave, bob)
+        self.assertEqual(dave.name, "Dave")
+        self.assertEqual(dave.nationality, "FR")
+        self.assertAlmostEqual(dave.total_repayments, 0.0)
+        self.assertAlmostEqual(dave.get_outstanding_debt(), 0.0)
+
     # --- Lending Tests ---
     def test_lend_successful(self):
         """Verify successful loan issuance and debt calculation."""
@@ -203,6 +688,16 @@ class TestBankSystem(unittest.TestCase):
         # Verify profile data persists after re-lending
         self.assertEqual(self.bank.customers["Bob"].nationality, "US")
 
+    def test_lend_updates_existing_customer(self):
+        """Verify re-lending updates the same customer object and resets its repayments."""
+        bob = self.bank.customers["Bob"]
+        self.bank.lend("Bob", 100.00, 0.20)  # Total debt = $120.00
+        self.bank.receive_repayment("Bob", 50.00)
+        self.bank.lend("Bob", 300.00, 0.10)  # Total debt = $330.00
+        self.assertIs(self.bank.customers["Bob"], bob)
+        self.assertAlmostEqual(bob.total_repayments, 0.0)
+        self.assertAlmostEqual(bob.get_outstanding_debt(), 330.00)
+
     def test_lend_non_existent_customer(self):
         """Verify lending fails for a non-existent customer."""
         self.assertFalse(self.bank.lend("Noname", 100.00, 0.10))
@@ -212,6 +707,31 @@ class TestBankSystem(unittest.TestCase):
         self.assertFalse(self.bank.lend("Bob", 0.00, 0.10))
         self.assertFalse(self.bank.lend("Bob", -50.00, 0.10))
 
+    def test_lend_batch(self):
+        """Verify a batch of loans matches issuing them one by one."""
+        self.bank.create_customer("Charlie", "UK", "charlie@test.co.uk", "C123")
+        self.assertTrue(self.bank.lend_batch(["Bob", "Charlie"], [100.00, 200.00], [0.20, 0.10]))
+        self.assertAlmostEqual(self.bank.get_customer_status("Bob")['outstanding_debt'], 120.00)
+        self.assertAlmostEqual(self.bank.get_customer_status("Charlie")['outstanding_debt'], 220.00)
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 340.00)
+
+    def test_lend_batch_rejects_invalid_entries(self):
+        """Verify the whole batch is rejected when any entry is invalid."""
+        self.assertFalse(self.bank.lend_batch(["Bob", "Noname"], [100.00, 100.00], [0.10, 0.10]))
+        self.assertFalse(self.bank.lend_batch(["Bob"], [-5.00], [0.10]))
+        self.assertFalse(self.bank.lend_batch(["Bob"], [100.00, 200.00], [0.10]))
+        self.assertAlmostEqual(self.bank.get_customer_status("Bob")['outstanding_debt'], 0.0)
+
+    def test_lend_batch_bad_rate_changes_nothing(self):
+        """Verify a bad interest rate late in the batch leaves every customer unchanged."""
+        self.bank.create_customer("Charlie", "UK", "charlie@test.co.uk", "C123")
+        self.bank.lend("Charlie", 50.00, 0.0)  # Total debt = $50.00
+        self.assertFalse(self.bank.lend_batch(["Bob", "Charlie"], [100.00, 100.00], [0.10, float('nan')]))
+        self.assertFalse(self.bank.lend_batch(["Bob", "Charlie"], [100.00, float('inf')], [0.10, 0.10]))
+        self.assertAlmostEqual(self.bank.get_customer_status("Bob")['outstanding_debt'], 0.0)
+        self.assertAlmostEqual(self.bank.get_customer_status("Charlie")['outstanding_debt'], 50.00)
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 50.00)
+
     # --- Repayment Tests ---
     def test_receive_repayment_partial(self):
         """Test a partial repayment."""
@@ -244,15 +764,163 @@ class TestBankSystem(unittest.TestCase):
         self.assertAlmostEqual(status['outstanding_debt'], 0.00)
         self.assertAlmostEqual(status['total_repayments'], 100.00)
 
+    def test_receive_repayment_rejects_non_positive_amounts(self):
+        """Test zero and negative repayments are rejected by both repayment paths."""
+        self.bank.lend("Bob", 100.00, 0.0)  # Total debt = $100.00
+        self.assertAlmostEqual(self.bank.receive_repayment("Bob", -50.00), 0.0)
+        self.assertAlmostEqual(self.bank.receive_repayment("Bob", 0.00), 0.0)
+        self.bank.receive_repayment("Bob", 100.00)
+
+        # A negative batch amount on settled debt must not reopen it
+        self.assertEqual(self.bank.receive_repayment_batch(["Bob", "Bob"], [-50.00, 0.00]), [0.0, 0.0])
+        status = self.bank.get_customer_status("Bob")
+        self.assertAlmostEqual(status['outstanding_debt'], 0.00)
+        self.assertAlmostEqual(status['total_repayments'], 100.00)
+
+    def test_non_finite_amounts_are_rejected(self):
+        """Test inf and nan are rejected by lend and receive_repayment instead of raising."""
+        self.assertFalse(self.bank.lend("Bob", float('inf'), 0.10))
+        self.assertFalse(self.bank.lend("Bob", 100.00, float('nan')))
+        self.bank.lend("Bob", 100.00, 0.20)  # Total debt = $120.00
+        self.assertAlmostEqual(self.bank.receive_repayment("Bob", float('inf')), 0.0)
+        self.assertAlmostEqual(self.bank.receive_repayment("Bob", float('nan')), 0.0)
+        self.assertAlmostEqual(self.bank.get_customer_status("Bob")['outstanding_debt'], 120.00)
+        with self.assertRaises(ValueError):
+            self.bank.customers["Bob"].total_repayments = float('nan')
+
+    def test_amounts_beyond_the_loan_columns_are_rejected(self):
+        """Test amounts too large for the int64 loan columns are refused and leave both sides in agreement."""
+        self.assertFalse(self.bank.lend("Bob", 1e17, 0.10))
+        self.assertFalse(self.bank.lend("Bob", 100.00, 1e3))
+        self.assertEqual(self.bank.get_customer_status("Bob"), {"total_repayments": 0.0, "outstanding_debt": 0.0})
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 0.0)
+
+        # The largest loan at the largest rate still fits the columns and can be saved
+        self.assertTrue(self.bank.lend("Bob", 1e13, 100.0))
+        bob = self.bank.customers["Bob"]
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), bob.get_outstanding_debt())
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertTrue(self.bank.save(os.path.join(directory, "bank.dat")))
+
     def test_receive_repayment_non_existent_customer(self):
         """Test repayment fails for a non-existent customer."""
         self.assertIsNone(self.bank.receive_repayment("Noname", 10.00))
 
+    def test_receive_repayment_batch(self):
+        """Test batch repayments are capped at each customer's outstanding debt."""
+        self.bank.create_customer("Charlie", "UK", "charlie@test.co.uk", "C123")
+        self.bank.create_customer("Dave", "FR", "dave@test.fr", "D456")
+        self.bank.lend_batch(["Bob", "Charlie"], [100.00, 200.00], [0.20, 0.10])  # $120.00 and $220.00
+        paid = self.bank.receive_repayment_batch(["Bob", "Charlie", "Dave", "Bob"], [100.00, 300.00, 10.00, 50.00])
+        # Bob's second payment is capped at the $20.00 left after his first one, Dave owes nothing
+        self.assertEqual(paid, [100.00, 220.00, 0.0, 20.00])
+        self.assertAlmostEqual(self.bank.get_customer_status("Bob")['outstanding_debt'], 0.0)
+        self.assertAlmostEqual(self.bank.get_total_repayments(), 340.00)
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 0.0)
+
+    def test_receive_repayment_batch_non_finite_amount(self):
+        """Test a non-finite amount in a batch is rejected like a non-positive one."""
+        self.bank.create_customer("Charlie", "UK", "charlie@test.co.uk", "C123")
+        self.bank.lend_batch(["Bob", "Charlie"], [100.00, 200.00], [0.20, 0.10])
+        paid = self.bank.receive_repayment_batch(["Bob", "Charlie", "Charlie"], [10.00, float('inf'), float('nan')])
+        self.assertEqual(paid, [10.00, 0.0, 0.0])
+        self.assertAlmostEqual(self.bank.get_customer_status("Charlie")['outstanding_debt'], 220.00)
+        self.assertAlmostEqual(self.bank.get_total_repayments(), 10.00)
+
+    def test_receive_repayment_batch_invalid(self):
+        """Test a batch with an unknown customer or mismatched lengths is rejected."""
+        self.bank.lend("Bob", 100.00, 0.20)
+        self.assertIsNone(self.bank.receive_repayment_batch(["Bob", "Noname"], [10.00, 10.00]))
+        self.assertIsNone(self.bank.receive_repayment_batch(["Bob"], [10.00, 10.00]))
+        self.assertAlmostEqual(self.bank.get_customer_status("Bob")['total_repayments'], 0.0)
+
     # --- Status Tests ---
     def test_get_customer_status_non_existent(self):
         """Test getting status for a customer who was never created."""
         self.assertIsNone(self.bank.get_customer_status("Invisible"))
 
+    # --- Portfolio Tests ---
+    def test_portfolio_totals(self):
+        """Verify portfolio-wide totals across several customers."""
+        self.bank.create_customer("Charlie", "UK", "charlie@test.co.uk", "C123")
+        self.bank.lend("Bob", 100.00, 0.20)  # Total debt = $120.00
+        self.bank.lend("Charlie", 200.00, 0.10)  # Total debt = $220.00
+        self.bank.receive_repayment("Bob", 50.00)
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 290.00)
+        self.assertAlmostEqual(self.bank.get_total_repayments(), 50.00)
+
+        # Removing Bob drops his loan from the totals, Charlie's row stays intact
+        self.bank.remove_customer("Bob")
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 220.00)
+        self.assertAlmostEqual(self.bank.get_total_repayments(), 0.0)
+        self.bank.receive_repayment("Charlie", 20.00)
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 200.00)
+
+    def test_portfolio_totals_follow_customer_updates(self):
+        """Verify repayments recorded directly on a customer show up in the portfolio totals."""
+        self.bank.lend("Bob", 100.00, 0.20)  # Total debt = $120.00
+        self.bank.customers["Bob"].total_repayments = 50.00
+        self.assertAlmostEqual(self.bank.get_total_repayments(), 50.00)
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 70.00)
+
+        # A batch payment starts from the recorded repayment instead of resetting it
+        self.assertEqual(self.bank.receive_repayment_batch(["Bob"], [20.00]), [20.00])
+        self.assertEqual(self.bank.get_customer_status("Bob"), {"total_repayments": 70.00, "outstanding_debt": 50.00})
+        self.assertAlmostEqual(self.bank.get_total_outstanding_debt(), 50.00)
+
+    # --- Persistence Tests ---
+    def test_save_and_load(self):
+        """Verify a saved bank loads back with the same profiles, loans and repayments."""
+        self.bank.create_customer("Charlie", "UK", "charlie@test.co.uk", "C123")
+        self.bank.lend("Bob", 100.00, 0.20)  # Total debt = $120.00
+        self.bank.lend("Charlie", 333.33, 0.05)  # Total debt = $350.00
+        self.bank.receive_repayment("Bob", 50.00)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bank.dat")
+            self.assertTrue(self.bank.save(path))
+            loaded = BankSystem.load(path)
+
+        self.assertEqual(set(loaded.customers), {"Bob", "Charlie"})
+        self.assertEqual(loaded.customers["Bob"].email, "bob@test.com")
+        self.assertAlmostEqual(loaded.customers["Charlie"].interest_rate, 0.05)
+        self.assertEqual(loaded.get_customer_status("Bob"), {"total_repayments": 50.00, "outstanding_debt": 70.00})
+        self.assertAlmostEqual(loaded.get_total_outstanding_debt(), 420.00)
+
+        # The loaded bank keeps working like the original one
+        self.assertAlmostEqual(loaded.receive_repayment("Charlie", 400.00), 350.00)
+        self.assertAlmostEqual(loaded.get_total_outstanding_debt(), 70.00)
+
+    def test_save_and_load_empty_bank(self):
+        """Verify an empty bank round-trips and an oversized profile field is refused."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bank.dat")
+            self.assertTrue(BankSystem().save(path))
+            self.assertEqual(BankSystem.load(path).customers, {})
+
+            # A profile edited past its field size after creation is refused by save
+            self.bank.customers["Bob"].email = "b" * 257
+            self.assertFalse(self.bank.save(path))
+
+    def test_load_rejects_invalid_files(self):
+        """Verify missing files, foreign files and files with duplicate customers are refused."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bank.dat")
+            self.assertIsNone(BankSystem.load(path))
+
+            # Right size for records but no header
+            with open(path, "wb") as f:
+                f.write(bytes(_RECORD.size))
+            self.assertIsNone(BankSystem.load(path))
+
+            # The same customer record stored twice
+            self.assertTrue(self.bank.save(path))
+            with open(path, "rb") as f:
+                data = f.read()
+            with open(path, "wb") as f:
+                f.write(data + data[_FILE_HEADER.size:])
+            self.assertIsNone(BankSystem.load(path))
+
     # --- Challenge Scenario Test ---
     def test_challenge_example_scenario(self):
         """Verify the exact scenario provided in the instructions."""